@@ -6,17 +6,22 @@ Ghost in the Machine Labs
 Detects hardware, allocates memory budget, launches Ollama with optimal settings.
 """
 
+import bisect
 import subprocess
 import platform
 import os
+import shutil
 import sys
 import json
-import yaml
 import time
 from pathlib import Path
-from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+# Resolved once; platform checks below are plain boolean tests
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == 'Windows'
+_IS_LINUX = _SYSTEM == 'Linux'
+
 # ============================================================================
 # MODEL SPECIFICATIONS
 # ============================================================================
@@ -45,8 +50,20 @@ MODELS = {
     'qwen3:30b-a3b': {'base_gb': 18.0, 'kv_gb': 1.2, 'tier': 4, 'source': 'qwen3:30b-a3b'},
 }
 
+# Column-wise (SoA) view of MODELS for the allocator, indexed via _MODEL_IDX
+_MODEL_IDX = {name: i for i, name in enumerate(MODELS)}
+_MODEL_BASE_GB = tuple(m['base_gb'] for m in MODELS.values())
+_MODEL_KV_GB = tuple(m['kv_gb'] for m in MODELS.values())
+_MODEL_TIER = tuple(m['tier'] for m in MODELS.values())
+_MODEL_SOURCE = tuple(m['source'] for m in MODELS.values())
+_DEFAULT_MODEL_IDX = _MODEL_IDX['qwen3:4b']  # Spec for unknown model names
+
 # Parallel steps to try (descending)
 PARALLEL_STEPS = [24, 20, 16, 12, 8, 6, 4, 2, 1]
+PARALLEL_STEPS_SORTED = sorted(PARALLEL_STEPS)  # Ascending, for bisect
+
+# Share of peak parallel targeted per tier (index = tier; last is catch-all)
+_TIER_WEIGHTS = (0.0, 1.0, 0.75, 0.5, 0.33)
 
 # ============================================================================
 # HARDWARE PROFILES
@@ -103,16 +120,29 @@ HARDWARE_PROFILES = {
     },
 }
 
+# Filled in for any key a profile leaves out, so consumers can index directly
+_HARDWARE_DEFAULTS = {
+    'reserve_pct': 0.15,
+    'peak_parallel': 16,
+    'max_parallel': 24,
+    'env': {},
+}
+
 # ============================================================================
 # HARDWARE DETECTION
 # ============================================================================
 
+PROBE_TIMEOUT = 2      # A vendor tool that hasn't answered in 2s is broken
+WMI_PROBE_TIMEOUT = 5  # PowerShell + WMI cold start alone can take ~2s
+
 def detect_nvidia_gpu() -> Optional[Dict]:
     """Detect NVIDIA GPU and memory"""
+    if not shutil.which('nvidia-smi'):
+        return None
     try:
         result = subprocess.run(
             ['nvidia-smi', '--query-gpu=name,memory.total', '--format=csv,noheader,nounits'],
-            capture_output=True, text=True, timeout=10
+            capture_output=True, text=True, timeout=PROBE_TIMEOUT
         )
         if result.returncode == 0:
             line = result.stdout.strip().split('\n')[0]
@@ -126,34 +156,76 @@ def detect_nvidia_gpu() -> Optional[Dict]:
         pass
     return None
 
+def _amd_device_names_from_registry() -> List[str]:
+    """Friendly names of AMD (PCI vendor 1002) devices from the Windows registry"""
+    import winreg
+    names = []
+    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                        r'SYSTEM\CurrentControlSet\Enum\PCI') as pci:
+        i = 0
+        while True:
+            try:
+                device_id = winreg.EnumKey(pci, i)
+            except OSError:
+                break
+            i += 1
+            if not device_id.upper().startswith('VEN_1002'):
+                continue
+            with winreg.OpenKey(pci, device_id) as device:
+                j = 0
+                while True:
+                    try:
+                        instance_id = winreg.EnumKey(device, j)
+                    except OSError:
+                        break
+                    j += 1
+                    try:
+                        with winreg.OpenKey(device, instance_id) as instance:
+                            desc, _ = winreg.QueryValueEx(instance, 'DeviceDesc')
+                    except OSError:
+                        continue
+                    # e.g. "@oem3.inf,%amd1586.1%;AMD Radeon(TM) 8060S Graphics"
+                    names.append(desc.rsplit(';', 1)[-1])
+    return names
+
 def detect_amd_gpu() -> Optional[Dict]:
     """Detect AMD GPU - check Windows first, then ROCm"""
-    system = platform.system()
     
-    if system == 'Windows':
-        # Check for Radeon via PowerShell
+    if _IS_WINDOWS:
+        # Registry walk first (no process spawn, a few ms)
         try:
-            result = subprocess.run(
-                ['powershell', '-Command', 
-                 'Get-WmiObject Win32_VideoController | Where-Object {$_.Name -like "*Radeon*"} | Select-Object Name,AdapterRAM'],
-                capture_output=True, text=True, timeout=10
-            )
-            if 'Radeon' in result.stdout:
-                # AdapterRAM is unreliable for unified memory, use profile detection
-                if '8060S' in result.stdout or 'MAX+' in result.stdout.upper():
-                    return {
-                        'vendor': 'amd',
-                        'name': 'AMD Radeon 8060S (Ryzen AI MAX+)',
-                        'memory_gb': None  # Will be set by profile
-                    }
-        except Exception:
-            pass
+            devices = '\n'.join(_amd_device_names_from_registry())
+        except OSError:
+            devices = None
+        
+        # Fall back to PowerShell/WMI if the registry is unreadable
+        if devices is None and shutil.which('powershell'):
+            try:
+                result = subprocess.run(
+                    ['powershell', '-Command', 
+                     'Get-WmiObject Win32_VideoController | Where-Object {$_.Name -like "*Radeon*"} | Select-Object Name,AdapterRAM'],
+                    capture_output=True, text=True, timeout=WMI_PROBE_TIMEOUT
+                )
+                devices = result.stdout
+            except Exception:
+                pass
+        
+        if devices and 'Radeon' in devices:
+            # AdapterRAM is unreliable for unified memory, use profile detection
+            if '8060S' in devices or 'MAX+' in devices.upper():
+                return {
+                    'vendor': 'amd',
+                    'name': 'AMD Radeon 8060S (Ryzen AI MAX+)',
+                    'memory_gb': None  # Will be set by profile
+                }
     else:
         # Try ROCm
+        if not shutil.which('rocm-smi'):
+            return None
         try:
             result = subprocess.run(
                 ['rocm-smi', '--showmeminfo', 'vram'],
-                capture_output=True, text=True, timeout=10
+                capture_output=True, text=True, timeout=PROBE_TIMEOUT
             )
             if result.returncode == 0:
                 # Parse ROCm output
@@ -167,35 +239,121 @@ def detect_amd_gpu() -> Optional[Dict]:
 
 def detect_system_memory() -> float:
     """Detect total system memory in GB"""
-    system = platform.system()
-    
-    if system == 'Windows':
+    if _IS_WINDOWS:
+        import ctypes
+
+        # GlobalMemoryStatusEx - no PowerShell spawn
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ('dwLength', ctypes.c_ulong),
+                ('dwMemoryLoad', ctypes.c_ulong),
+                ('ullTotalPhys', ctypes.c_ulonglong),
+                ('ullAvailPhys', ctypes.c_ulonglong),
+                ('ullTotalPageFile', ctypes.c_ulonglong),
+                ('ullAvailPageFile', ctypes.c_ulonglong),
+                ('ullTotalVirtual', ctypes.c_ulonglong),
+                ('ullAvailVirtual', ctypes.c_ulonglong),
+                ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+            ]
         try:
-            result = subprocess.run(
-                ['powershell', '-Command', 
-                 '(Get-CimInstance Win32_ComputerSystem).TotalPhysicalMemory / 1GB'],
-                capture_output=True, text=True, timeout=10
-            )
-            return float(result.stdout.strip())
+            stat = MEMORYSTATUSEX()
+            stat.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat)):
+                return stat.ullTotalPhys / 2**30
         except Exception:
             pass
     else:
+        # Linux: sysconf gives physical pages directly
         try:
-            with open('/proc/meminfo', 'r') as f:
-                for line in f:
-                    if line.startswith('MemTotal:'):
-                        kb = int(line.split()[1])
-                        return kb / 1024 / 1024
+            return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') / 2**30
+        except (ValueError, OSError, AttributeError):
+            pass
+        # macOS: SC_PHYS_PAGES not available, ask the kernel via sysctl
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None)
+            memsize = ctypes.c_uint64(0)
+            size = ctypes.c_size_t(ctypes.sizeof(memsize))
+            if libc.sysctlbyname(b'hw.memsize', ctypes.byref(memsize),
+                                 ctypes.byref(size), None, ctypes.c_size_t(0)) == 0:
+                return memsize.value / 2**30
         except Exception:
             pass
     return 64.0  # Default fallback
 
+HW_CACHE_PATH = Path.home() / '.harmonic_stack' / 'hw_cache.json'
+HW_CACHE_TTL = 24 * 3600  # Hardware doesn't change between launches
+# 'detected' prefix of the system-memory fallback; such results are never
+# cached, since a probe that merely timed out should be retried next launch
+FALLBACK_DETECTED = 'Unknown'
+# Only what the probes found is cached; the rest comes from HARDWARE_PROFILES
+HW_PROBE_KEYS = ('profile', 'detected', 'gpu_mem_gb')
+
+def cached_hardware(detect):
+    """
+    Cache detection results on disk, keyed by hostname + platform.
+    Only identified hardware is cached, not the system-memory fallback,
+    and only the probe result (HW_PROBE_KEYS); unreadable entries are misses.
+    Pass refresh=True to bypass the cache and re-probe.
+    """
+    import functools
+
+    @functools.wraps(detect)
+    def wrapper(refresh: bool = False) -> Dict:
+        import hashlib
+        import socket
+        key = hashlib.blake2b(
+            (socket.gethostname() + platform.platform()).encode()
+        ).hexdigest()[:16]
+
+        cache = {}
+        try:
+            with open(HW_CACHE_PATH, 'r') as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                cache = {}
+            if not refresh:
+                # Anything missing or malformed below is just a cache miss
+                entry = cache[key]
+                probe = entry['probe']
+                if (time.time() - entry['ts'] < HW_CACHE_TTL
+                        and isinstance(probe['gpu_mem_gb'], (int, float))
+                        and not probe['detected'].startswith(FALLBACK_DETECTED)):
+                    # Rebuilt from the current tables, so profile edits apply
+                    return {**_HARDWARE_DEFAULTS,
+                            **HARDWARE_PROFILES[probe['profile']],
+                            **{k: probe[k] for k in HW_PROBE_KEYS}}
+        except Exception:
+            pass
+
+        hw = detect()
+        if hw['detected'].startswith(FALLBACK_DETECTED):
+            return hw
+        cache[key] = {'ts': time.time(),
+                      'probe': {k: hw[k] for k in HW_PROBE_KEYS}}
+        try:
+            HW_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp = HW_CACHE_PATH.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp, HW_CACHE_PATH)
+        except Exception:
+            pass
+        return hw
+
+    return wrapper
+
+@cached_hardware
 def detect_hardware() -> Dict:
-    """Auto-detect hardware and select best profile"""
-    
-    # Check for DGX Spark specifically
-    system = platform.system()
-    if system == 'Linux':
+    """Auto-detect hardware and select best profile (all defaults filled in)"""
+    return {**_HARDWARE_DEFAULTS, **_select_profile()}
+
+def _select_profile() -> Dict:
+    """Run the hardware probes and pick the matching profile"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Check for DGX Spark specifically (before spawning any probe)
+    if _IS_LINUX:
         try:
             with open('/etc/hostname', 'r') as f:
                 hostname = f.read().strip().lower()
@@ -207,20 +365,27 @@ def detect_hardware() -> Dict:
                     }
         except Exception:
             pass
-        
-        # Check for GB10 chip
-        nvidia = detect_nvidia_gpu()
-        if nvidia and 'GB10' in nvidia.get('name', ''):
-            return {
-                'profile': 'dgx_spark',
-                'detected': nvidia['name'],
-                **HARDWARE_PROFILES['dgx_spark']
-            }
+
+    # Run the (subprocess-bound) probes concurrently, then apply priority
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        nvidia_future = pool.submit(detect_nvidia_gpu)
+        amd_future = pool.submit(detect_amd_gpu)
+        sys_mem_future = pool.submit(detect_system_memory)
+
+        nvidia = nvidia_future.result()
+        amd = amd_future.result()
+        sys_mem = sys_mem_future.result()
+
+    # Check for GB10 chip
+    if _IS_LINUX and nvidia and 'GB10' in nvidia.get('name', ''):
+        return {
+            'profile': 'dgx_spark',
+            'detected': nvidia['name'],
+            **HARDWARE_PROFILES['dgx_spark']
+        }
     
     # Check for AMD (X2)
-    amd = detect_amd_gpu()
     if amd:
-        sys_mem = detect_system_memory()
         # Estimate GPU allocation based on system memory
         # X2 typically has 64GB or 92GB GPU from 128GB total
         if sys_mem >= 120:
@@ -234,7 +399,6 @@ def detect_hardware() -> Dict:
         }
     
     # Check NVIDIA generic
-    nvidia = detect_nvidia_gpu()
     if nvidia:
         mem = nvidia['memory_gb']
         if mem >= 100:
@@ -255,22 +419,25 @@ def detect_hardware() -> Dict:
         }
     
     # Fallback: use system memory as proxy
-    sys_mem = detect_system_memory()
     if sys_mem >= 120:
-        return {'profile': 'evo_x2_92gb', 'detected': 'Unknown (128GB RAM)', **HARDWARE_PROFILES['evo_x2_92gb']}
+        return {'profile': 'evo_x2_92gb', 'detected': f'{FALLBACK_DETECTED} (128GB RAM)', **HARDWARE_PROFILES['evo_x2_92gb']}
     elif sys_mem >= 60:
-        return {'profile': 'evo_x2_64gb', 'detected': 'Unknown (64GB RAM)', **HARDWARE_PROFILES['evo_x2_64gb']}
+        return {'profile': 'evo_x2_64gb', 'detected': f'{FALLBACK_DETECTED} (64GB RAM)', **HARDWARE_PROFILES['evo_x2_64gb']}
     else:
-        return {'profile': 'generic_24gb', 'detected': 'Unknown', **HARDWARE_PROFILES['generic_24gb']}
+        return {'profile': 'generic_24gb', 'detected': FALLBACK_DETECTED, **HARDWARE_PROFILES['generic_24gb']}
 
 # ============================================================================
 # MEMORY ALLOCATION
 # ============================================================================
 
-def model_memory(model_name: str, parallel: int) -> float:
-    """Calculate memory for model at given parallelism"""
-    spec = MODELS.get(model_name, MODELS.get('qwen3:4b'))
-    return spec['base_gb'] + (parallel * spec['kv_gb'])
+def model_memory(model_name: str, parallel: int, loaded_sources=()) -> float:
+    """
+    Calculate memory for model at given parallelism.
+    Weights are free if the model's source is already in loaded_sources.
+    """
+    i = _MODEL_IDX.get(model_name, _DEFAULT_MODEL_IDX)
+    base = 0.0 if _MODEL_SOURCE[i] in loaded_sources else _MODEL_BASE_GB[i]
+    return base + (parallel * _MODEL_KV_GB[i])
 
 def allocate_stack(
     models: List[str],
@@ -279,62 +446,108 @@ def allocate_stack(
 ) -> Dict[str, Dict]:
     """
     Allocate parallel slots to models based on tier priority.
-    Higher tier models get slots first, then lower tiers fill remaining.
+
+    Searches every combination of per-model parallel steps (memoized on the
+    remaining models, free memory and loaded sources) and keeps the one that
+    fits the most models, then the most tier-weighted parallel slots, within
+    the memory budget. Ties go to higher tiers.
+
+    Roles sharing a source model share its weights: base_gb is charged once
+    per source (to the first allocated role), kv_gb per role and slot.
     """
     gpu_mem = hardware['gpu_mem_gb']
-    reserve = hardware.get('reserve_pct', 0.15)
-    peak_parallel = hardware.get('peak_parallel', 16)
-    max_parallel = hardware.get('max_parallel', 24)
+    reserve = hardware['reserve_pct']
+    peak_parallel = hardware['peak_parallel']
+    max_parallel = hardware['max_parallel']
     
     available = gpu_mem * (1 - reserve)
     allocation = {}
     
     # Sort models by tier (lower tier = higher priority)
-    model_specs = [(m, MODELS.get(m, MODELS['qwen3:4b'])) for m in models]
-    model_specs.sort(key=lambda x: x[1]['tier'])
-    
-    # First pass: allocate at peak parallel for tier 1, scale down for others
-    for model_name, spec in model_specs:
-        tier = spec['tier']
-        
-        # Tier-based parallel target
-        if tier == 1:
-            target_parallel = peak_parallel
-        elif tier == 2:
-            target_parallel = int(peak_parallel * 0.75)
-        elif tier == 3:
-            target_parallel = int(peak_parallel * 0.5)
-        else:
-            target_parallel = int(peak_parallel * 0.33)
-        
+    rows = [_MODEL_IDX.get(m, _DEFAULT_MODEL_IDX) for m in models]
+    order = sorted(range(len(models)), key=lambda j: _MODEL_TIER[rows[j]])
+    names = [models[j] for j in order]
+    rows = [rows[j] for j in order]
+    
+    # KV memory for every (model, parallel step) pair, computed once;
+    # weights (base) are charged separately, once per source
+    base = [_MODEL_BASE_GB[r] for r in rows]
+    kv = [_MODEL_KV_GB[r] for r in rows]
+    tiers = [_MODEL_TIER[r] for r in rows]
+    sources = [_MODEL_SOURCE[r] for r in rows]
+    mem_matrix = [[p * k for p in PARALLEL_STEPS_SORTED] for k in kv]
+    
+    # Usable steps per model are PARALLEL_STEPS_SORTED[lo:step_hi[i]]
+    lo = bisect.bisect_left(PARALLEL_STEPS_SORTED, min_parallel)
+    step_hi = []
+    weights = []
+    for tier in tiers:
+        # Tier-based share of peak parallel
+        share = _TIER_WEIGHTS[min(tier, len(_TIER_WEIGHTS) - 1)]
+        target_parallel = int(peak_parallel * share)
         target_parallel = max(min_parallel, min(target_parallel, max_parallel))
         
-        # Find highest parallel that fits
-        allocated = False
-        for p in PARALLEL_STEPS:
-            if p > target_parallel:
-                continue
-            if p < min_parallel:
-                break
-                
-            mem_needed = model_memory(model_name, p)
-            if mem_needed <= available:
-                allocation[model_name] = {
-                    'parallel': p,
-                    'memory_gb': round(mem_needed, 1),
-                    'tier': tier,
-                    'source': spec.get('source', model_name)
-                }
-                available -= mem_needed
-                allocated = True
-                break
+        step_hi.append(bisect.bisect_right(PARALLEL_STEPS_SORTED, target_parallel))
+        weights.append(share)
+    
+    # Best (models, weighted slots, picks) for models i.. given the free memory
+    # and which still-needed sources are loaded. That state fully determines
+    # the answer, so results are memoized: memory figures are in tenths of a
+    # GB, keeping the distinct free values (and the work) small.
+    n = len(names)
+    needed = [frozenset(sources[i:]) for i in range(n)]
+    memo = {}
+    
+    def search(i: int, free: float, loaded: frozenset):
+        if i == n:
+            return (0, 0.0, ())
+        key = (i, round(free, 6), loaded & needed[i])
+        hit = memo.get(key)
+        if hit is not None:
+            return hit
+        source = sources[i]
+        weights_gb = 0.0 if source in loaded else base[i]
         
-        if not allocated:
+        # Largest step that fits: solve weights + p * kv <= free, snap down
+        top = lo
+        if free + 1e-9 >= weights_gb:
+            p_fit = int((free - weights_gb) / kv[i] + 1e-9)
+            top = min(step_hi[i], bisect.bisect_right(PARALLEL_STEPS_SORTED, p_fit))
+        
+        # Higher steps first, skipping last: the first of equal scores wins
+        best = None
+        with_source = loaded | {source}
+        for idx in range(top - 1, lo - 1, -1):
+            mem_needed = weights_gb + mem_matrix[i][idx]
+            if mem_needed <= free + 1e-9:  # Same tolerance as the memo key
+                p = PARALLEL_STEPS_SORTED[idx]
+                count, slots, picks = search(i + 1, free - mem_needed, with_source)
+                slots += p * weights[i]
+                if best is None or (count + 1, round(slots, 9)) > (best[0], round(best[1], 9)):
+                    best = (count + 1, slots, ((p, mem_needed),) + picks)
+        count, slots, picks = search(i + 1, free, loaded)
+        if best is None or (count, round(slots, 9)) > (best[0], round(best[1], 9)):
+            best = (count, slots, (None,) + picks)
+        memo[key] = best
+        return best
+    
+    picks = search(0, available, frozenset())[2]
+    
+    for i, (model_name, picked) in enumerate(zip(names, picks)):
+        if picked:
+            p, mem_needed = picked
+            allocation[model_name] = {
+                'parallel': p,
+                'memory_gb': round(mem_needed, 1),
+                'tier': tiers[i],
+                'source': sources[i]
+            }
+        else:
             allocation[model_name] = {
                 'parallel': 0,
                 'memory_gb': 0,
-                'tier': tier,
-                'source': spec.get('source', model_name),
+                'tier': tiers[i],
+                'source': sources[i],
                 'status': 'skipped'
             }
     
@@ -344,20 +557,26 @@ def allocate_stack(
 # OLLAMA INTEGRATION
 # ============================================================================
 
-def check_ollama_running() -> bool:
-    """Check if Ollama is already running"""
+def check_ollama_running(conn=None) -> bool:
+    """Check if Ollama is already running (optionally over an open connection)"""
     try:
-        import urllib.request
-        req = urllib.request.urlopen('http://localhost:11434/api/tags', timeout=2)
-        return req.status == 200
+        if conn is None:
+            import urllib.request
+            req = urllib.request.urlopen('http://localhost:11434/api/tags', timeout=2)
+            return req.status == 200
+        conn.request('GET', '/api/tags')
+        resp = conn.getresponse()
+        resp.read()
+        return resp.status == 200
     except Exception:
+        if conn is not None:
+            conn.close()  # Reset state; next request reconnects
         return False
 
 def stop_ollama():
     """Stop running Ollama instances"""
-    system = platform.system()
     
-    if system == 'Windows':
+    if _IS_WINDOWS:
         subprocess.run(['taskkill', '/IM', 'ollama.exe', '/F'], 
                        capture_output=True, stderr=subprocess.DEVNULL)
     else:
@@ -373,14 +592,12 @@ def start_ollama(hardware: Dict, max_parallel: int):
     env['OLLAMA_NUM_PARALLEL'] = str(max_parallel)
     
     # Add hardware-specific env vars
-    for key, val in hardware.get('env', {}).items():
+    for key, val in hardware['env'].items():
         env[key] = val
     
-    system = platform.system()
-    
     print(f"Starting Ollama with NUM_PARALLEL={max_parallel}")
     
-    if system == 'Windows':
+    if _IS_WINDOWS:
         # Windows: use start /b for background
         subprocess.Popen(
             ['ollama', 'serve'],
@@ -399,73 +616,135 @@ def start_ollama(hardware: Dict, max_parallel: int):
             start_new_session=True
         )
     
-    # Wait for startup
-    for _ in range(30):
-        time.sleep(1)
-        if check_ollama_running():
-            print("Ollama started successfully")
-            return True
+    # Wait for startup: exponential backoff (25ms -> 1s) over one connection
+    import http.client
+    deadline = time.monotonic() + 30
+    delay = 0.025
+    conn = http.client.HTTPConnection('localhost', 11434, timeout=1)
+    try:
+        while time.monotonic() < deadline:
+            if check_ollama_running(conn):
+                print("Ollama started successfully")
+                return True
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+    finally:
+        conn.close()
     
     print("WARNING: Ollama may not have started correctly")
     return False
 
-def preload_models(allocation: Dict):
-    """Preload allocated models into Ollama"""
+def preload_models(allocation: Dict, max_parallel: int = 4):
+    """Preload allocated models into Ollama (concurrently, once per source)"""
+    import http.client
+    import threading
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    # Roles sharing a backbone only need it warmed once
+    sources = {}
     for model_name, cfg in allocation.items():
         if cfg.get('parallel', 0) > 0:
-            source = cfg.get('source', model_name)
-            print(f"Preloading {model_name} ({source})...")
-            try:
-                # Quick inference to load model
-                subprocess.run(
-                    ['ollama', 'run', source, '/nothink hi'],
-                    capture_output=True, timeout=60
-                )
-            except Exception as e:
-                print(f"  Warning: {e}")
+            sources.setdefault(cfg.get('source', model_name), []).append(model_name)
+    if not sources:
+        return
+    
+    # One keep-alive connection per worker thread (http.client isn't thread-safe)
+    local = threading.local()
+    connections = []
+    
+    def warm(source: str) -> int:
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = local.conn = http.client.HTTPConnection('localhost', 11434, timeout=120)
+            connections.append(conn)
+        # Empty prompt loads the weights without generating; keep them resident
+        body = json.dumps({'model': source, 'prompt': '', 'keep_alive': -1, 'stream': False})
+        try:
+            conn.request('POST', '/api/generate', body=body,
+                         headers={'Content-Type': 'application/json'})
+            resp = conn.getresponse()
+            resp.read()
+            return resp.status
+        except Exception:
+            conn.close()  # Reset state so the next request reconnects
+            raise
+    
+    workers = max(1, min(len(sources), max_parallel))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for source, names in sources.items():
+                print(f"Preloading {', '.join(names)} ({source})...")
+                futures[pool.submit(warm, source)] = source
+            
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    status = future.result()
+                    if status == 200:
+                        print(f"  Loaded {source}")
+                    else:
+                        print(f"  Warning: {source} returned HTTP {status}")
+                except Exception as e:
+                    print(f"  Warning: {source}: {e}")
+    finally:
+        for conn in connections:
+            conn.close()
 
 # ============================================================================
 # OUTPUT / REPORTING
 # ============================================================================
 
 def print_allocation(hardware: Dict, allocation: Dict):
-    """Print allocation summary"""
-    total_mem = sum(cfg.get('memory_gb', 0) for cfg in allocation.values())
-    available = hardware['gpu_mem_gb'] * (1 - hardware.get('reserve_pct', 0.15))
-    
-    print()
-    print("=" * 60)
-    print(f"HARMONIC STACK ALLOCATION")
-    print(f"Hardware: {hardware.get('name', hardware.get('detected', 'Unknown'))}")
-    print(f"GPU Memory: {hardware['gpu_mem_gb']}GB")
-    print("=" * 60)
-    
-    # Group by tier
-    tiers = {}
+    """Print allocation summary (built in full, then written once)"""
+    from collections import defaultdict
+    
+    # Group by tier and total memory in one pass
+    tiers = defaultdict(list)
+    total_mem = 0.0
     for model, cfg in allocation.items():
-        tier = cfg.get('tier', 9)
-        if tier not in tiers:
-            tiers[tier] = []
-        tiers[tier].append((model, cfg))
+        total_mem += cfg.get('memory_gb', 0)
+        tiers[cfg.get('tier', 9)].append((model, cfg))
+    
+    available = hardware['gpu_mem_gb'] * (1 - hardware['reserve_pct'])
+    
+    lines = [
+        "",
+        "=" * 60,
+        f"HARMONIC STACK ALLOCATION",
+        f"Hardware: {hardware.get('name', hardware.get('detected', 'Unknown'))}",
+        f"GPU Memory: {hardware['gpu_mem_gb']}GB",
+        "=" * 60,
+    ]
     
     tier_names = {1: 'EXECUTIVE', 2: 'DIRECTORS', 3: 'SPECIALISTS', 4: 'HEAVY'}
     
     for tier_num in sorted(tiers.keys()):
-        print(f"\n[Tier {tier_num}: {tier_names.get(tier_num, 'OTHER')}]")
+        lines.append(f"\n[Tier {tier_num}: {tier_names.get(tier_num, 'OTHER')}]")
         for model, cfg in tiers[tier_num]:
             if cfg.get('parallel', 0) > 0:
-                print(f"  {model:25} {cfg['parallel']:3}x  ({cfg['memory_gb']:.1f}GB)")
+                lines.append(f"  {model:25} {cfg['parallel']:3}x  ({cfg['memory_gb']:.1f}GB)")
             else:
-                print(f"  {model:25}  SKIPPED (insufficient memory)")
-    
-    print()
-    print("=" * 60)
-    print(f"Total Allocated: {total_mem:.1f}GB / {available:.1f}GB available")
-    print(f"Headroom: {available - total_mem:.1f}GB")
-    print("=" * 60)
+                lines.append(f"  {model:25}  SKIPPED (insufficient memory)")
+    
+    lines += [
+        "",
+        "=" * 60,
+        f"Total Allocated: {total_mem:.1f}GB / {available:.1f}GB available",
+        f"Headroom: {available - total_mem:.1f}GB",
+        "=" * 60,
+    ]
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 def save_config(hardware: Dict, allocation: Dict, path: str = None):
     """Save configuration to file"""
+    import yaml  # Only needed here; keep it off the --detect/--start paths
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+    
     if path is None:
         path = Path.home() / '.harmonic_stack' / 'config.yaml'
     
@@ -477,15 +756,15 @@ def save_config(hardware: Dict, allocation: Dict, path: str = None):
             'profile': hardware.get('profile'),
             'detected': hardware.get('detected'),
             'gpu_mem_gb': hardware['gpu_mem_gb'],
-            'peak_parallel': hardware.get('peak_parallel'),
-            'max_parallel': hardware.get('max_parallel'),
+            'peak_parallel': hardware['peak_parallel'],
+            'max_parallel': hardware['max_parallel'],
         },
         'allocation': allocation,
-        'env': hardware.get('env', {}),
+        'env': hardware['env'],
     }
     
     with open(path, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
+        yaml.dump(config, f, Dumper=Dumper, default_flow_style=False)
     
     print(f"\nConfiguration saved to: {path}")
 
@@ -513,15 +792,18 @@ def main():
                         help='Save configuration to file')
     parser.add_argument('--gpu-mem', type=int,
                         help='Override GPU memory (GB)')
+    parser.add_argument('--refresh-hw', action='store_true',
+                        help='Ignore cached hardware detection and re-probe')
     
     args = parser.parse_args()
     
     # Detect or use forced profile
     if args.profile:
-        hardware = {'profile': args.profile, **HARDWARE_PROFILES[args.profile]}
+        hardware = {**_HARDWARE_DEFAULTS, 'profile': args.profile,
+                    **HARDWARE_PROFILES[args.profile]}
         hardware['detected'] = f'Forced: {args.profile}'
     else:
-        hardware = detect_hardware()
+        hardware = detect_hardware(refresh=args.refresh_hw)
     
     if args.gpu_mem:
         hardware['gpu_mem_gb'] = args.gpu_mem
@@ -530,8 +812,8 @@ def main():
         print(f"Detected: {hardware.get('detected', 'Unknown')}")
         print(f"Profile: {hardware.get('profile')}")
         print(f"GPU Memory: {hardware['gpu_mem_gb']}GB")
-        print(f"Peak Parallel: {hardware.get('peak_parallel')}")
-        print(f"Environment: {hardware.get('env', {})}")
+        print(f"Peak Parallel: {hardware['peak_parallel']}")
+        print(f"Environment: {hardware['env']}")
         return
     
     # Default model stack
@@ -567,7 +849,7 @@ def main():
         start_ollama(hardware, max_parallel)
         
         if args.preload:
-            preload_models(allocation)
+            preload_models(allocation, max_parallel)
 
 if __name__ == '__main__':
     main()
@@ -58,6 +58,11 @@ Usage:
     operator.record_success(category="color_remap", approach="flood fill BFS", count=3)
     operator.record_failure(category="color_remap", approach="pixel-by-pixel comparison")
 
+Optional dependencies:
+    httpx (preferred) or aiohttp - async HTTP client for Ollama calls
+    orjson - faster JSON encode/decode of Ollama payloads (falls back to json)
+    uvloop - faster event loop for the __main__ demo (Linux/macOS)
+
 Notes on Thinking Mode (Qwen3 and similar):
     Qwen3 models have a "thinking mode" that dumps chain-of-thought into a
     separate field. For clean output, set "think": False in the Ollama API
@@ -68,16 +73,97 @@ Notes on Thinking Mode (Qwen3 and similar):
 """
 
 import asyncio
+import collections
+import hashlib
+import itertools
 import json
+import queue
 import time
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, Optional
+
+# Optional: orjson (de)serializes Ollama payloads several times faster
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _json_loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Briefing prompt: constant text built once; only the activity summary and
+# the group fields are filled in per call
+BRIEFING_PROMPT_HEAD = """You are the Operator coordinating research across multiple task groups.
+
+Current batch progress:
+"""
+
+BRIEFING_PROMPT_TAIL = """
+A new group is about to be researched:
+- Category: {category}
+- Group size: {group_size} tasks
+- Profile: {profile}
+
+In 2-3 sentences, suggest what the worker should consider:
+- What worked for similar tasks that might apply here?
+- What failed that should be avoided?
+- Any patterns you notice across groups?
+
+Be specific and concise. These are suggestions, not orders."""
+
+# Mechanical-context entry used on the cold path (no history to report)
+_EMPTY_MECH = (0, 0, "", b"")
+
+# httpx clients shared by all OperatorOversight instances talking to the same
+# Ollama endpoint from the same event loop: key -> [client, refcount]
+_SHARED_CLIENTS: Dict[tuple, list] = {}
+
+
+def _acquire_shared_client(key: tuple):
+    """Return the shared httpx client for key, creating it on first use."""
+    import httpx
+    entry = _SHARED_CLIENTS.get(key)
+    if entry is None:
+        entry = _SHARED_CLIENTS[key] = [httpx.AsyncClient(
+            timeout=key[2],
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        ), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def _release_shared_client(key: tuple):
+    """Drop one reference to a shared client; close it with the last one."""
+    entry = _SHARED_CLIENTS.get(key)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _SHARED_CLIENTS[key]
+        await entry[0].aclose()
+
+
+BRIEFING_SYSTEM = ("You are the Operator - an executive coordinator for AI research. "
+                   "Generate brief, specific suggestions to help workers "
+                   "avoid duplicating effort. Be direct and actionable.")
 
 # Default: use lightweight model for briefings (low overhead)
 DEFAULT_OPERATOR_MODEL = "analyst"  # 8B model, ~10s briefings
 DEFAULT_OPERATOR_TIMEOUT = 30       # Fast briefings only
 DEFAULT_OLLAMA_URL = "http://localhost:11434"
+BRIEFING_BATCH_WINDOW = 0.01        # Seconds to gather briefings into a batch
+BRIEFING_MAX_BATCH = 8              # Briefings dispatched together at most
+MAX_ACTIVITY_LOG = 10_000           # Observations retained (oldest dropped)
+MAX_APPROACHES = 2000               # Successes / failures retained each
+MAX_PER_CATEGORY = 64               # Per-category index depth
+BRIEFING_NUM_PREDICT = 128          # Token cap per briefing (2-3 sentences)
+BRIEFING_MAX_CHUNKS = 60            # Stop reading the stream after this many
+BREAKER_THRESHOLD = 3               # Consecutive failed briefings to trip
+BREAKER_COOLDOWN = 60               # Seconds to skip briefings once tripped
+BRIEFING_CACHE_SIZE = 256           # Completed briefings kept (LRU)
+BRIEFING_CACHE_TTL = 300            # Seconds a cached briefing stays valid
 
 
 class OperatorOversight:
@@ -100,33 +186,98 @@ class OperatorOversight:
                  operator_model: str = DEFAULT_OPERATOR_MODEL,
                  operator_timeout: int = DEFAULT_OPERATOR_TIMEOUT):
         self.ollama_url = ollama_url
+        self._generate_url = f"{ollama_url.rstrip('/')}/api/generate"
         self.operator_model = operator_model
         self.operator_timeout = operator_timeout
 
-        # State
-        self.activity_log: List[dict] = []
-        self.successful_approaches: List[dict] = []
-        self.failed_approaches: List[dict] = []
+        # State (bounded: long runs keep flat memory, oldest entries drop)
+        self.activity_log = collections.deque(maxlen=MAX_ACTIVITY_LOG)
+        self.successful_approaches = collections.deque(maxlen=MAX_APPROACHES)
+        self.failed_approaches = collections.deque(maxlen=MAX_APPROACHES)
         self.active_profiles: Dict[str, str] = {}
         self.groups_processed = 0
         self.total_suggestions_made = 0
 
-        # HTTP client
+        # Lifetime counts (the deques above stop growing at maxlen)
+        self.total_observations = 0
+        self.total_successes = 0
+        self.total_failures = 0
+
+        # observe()/record_*() only enqueue here (safe from any thread); the
+        # event loop applies the queue before reading state (_drain_pending)
+        self._pending: queue.SimpleQueue = queue.SimpleQueue()
+
+        # Per-category indices (newest MAX_PER_CATEGORY records per category)
+        self._succ_by_cat: Dict[str, collections.deque] = collections.defaultdict(
+            lambda: collections.deque(maxlen=MAX_PER_CATEGORY))
+        self._fail_by_cat: Dict[str, collections.deque] = collections.defaultdict(
+            lambda: collections.deque(maxlen=MAX_PER_CATEGORY))
+
+        # Mechanical context per category, valid while record counts match:
+        # category -> (total_successes, total_failures, text, utf-8 bytes)
+        self._mech_cache: Dict[str, tuple] = {}
+
+        # Briefings currently being generated, keyed by prompt hash;
+        # concurrent callers with the same prompt share one model call
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+
+        # Completed briefings by prompt hash: key -> (created, briefing)
+        self._briefing_cache: collections.OrderedDict = collections.OrderedDict()
+
+        # Circuit breaker: mechanical context only while the model is failing
+        self._breaker_fails = 0
+        self._breaker_open_until = 0.0
+
+        # HTTP client (httpx, shared per endpoint), or aiohttp session fallback
         self._client = None
+        self._client_key: Optional[tuple] = None
+        self._aiohttp_session = None
+
+        # Briefing batcher (started by initialize())
+        self._briefing_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._dispatch_tasks: set = set()
 
     async def initialize(self):
-        """Initialize async HTTP client."""
+        """Initialize async HTTP client and start the briefing batcher."""
         try:
-            import httpx
-            self._client = httpx.AsyncClient(timeout=self.operator_timeout + 10)
+            import httpx  # noqa: F401 - probe; the shared pool owns the client
+            self._client_key = (asyncio.get_running_loop(), self.ollama_url,
+                                self.operator_timeout + 10)
+            self._client = _acquire_shared_client(self._client_key)
         except ImportError:
-            import aiohttp
             self._client = None  # Will use aiohttp in _generate()
+            self._aiohttp_session = self._new_aiohttp_session()
+
+        self._briefing_queue = asyncio.Queue()
+        self._batch_task = asyncio.create_task(self._briefing_batcher())
 
     async def close(self):
-        """Clean up HTTP client."""
+        """Stop the briefing batcher and clean up HTTP client."""
+        if self._batch_task:
+            self._batch_task.cancel()
+            await asyncio.gather(self._batch_task, return_exceptions=True)
+            self._batch_task = None
+            # Let in-flight batches finish; release anything still queued
+            await asyncio.gather(*self._dispatch_tasks, return_exceptions=True)
+            while not self._briefing_queue.empty():
+                _, _, future = self._briefing_queue.get_nowait()
+                if not future.done():
+                    future.set_result(None)
         if self._client:
-            await self._client.aclose()
+            await _release_shared_client(self._client_key)
+            self._client = None
+        if self._aiohttp_session:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+
+    def _new_aiohttp_session(self):
+        """One keep-alive session shared by all briefings (aiohttp fallback)."""
+        import aiohttp
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=self.operator_timeout),
+        )
 
     # ── Observation Methods ────────────────────────────────────────
 
@@ -138,14 +289,14 @@ class OperatorOversight:
         Stages: "starting", "profiled", "solved", "failed", "generating"
         Category: any string grouping (e.g., "color_remap", "geometric", "code_gen")
         """
-        self.activity_log.append({
+        self._pending.put(("observe", {
             "task_id": task_id,
             "stage": stage,
             "model": model,
             "category": category,
             "detail": detail[:300],
-            "time": datetime.now().isoformat(),
-        })
+            "time": int(time.time()),  # Whole epoch seconds
+        }))
 
     def record_profile(self, task_id: str, profile: str):
         """Store completed profile for cross-reference."""
@@ -154,88 +305,206 @@ class OperatorOversight:
     def record_success(self, category: str, approach: str,
                        count: int = 1, profile: str = ""):
         """Record a successful approach for a category."""
-        self.successful_approaches.append({
+        approach = approach[:400]
+        record = {
             "category": category,
-            "approach": approach[:400],
+            "approach": approach,
             "profile": profile[:400],
             "count": count,
-        })
+            # Pre-truncated once for the briefing/context renderers
+            "approach_120": approach[:120],
+            "approach_150": approach[:150],
+        }
+        self._pending.put(("success", record))
 
     def record_failure(self, category: str, approach: str):
         """Record a failed approach for a category."""
-        self.failed_approaches.append({
+        approach = approach[:300]
+        record = {
             "category": category,
-            "approach": approach[:300],
-        })
+            "approach": approach,
+            # Pre-truncated once for the briefing/context renderers
+            "approach_80": approach[:80],
+            "approach_100": approach[:100],
+            "approach_120": approach[:120],
+        }
+        self._pending.put(("failure", record))
+
+    def _drain_pending(self):
+        """Apply queued observations/outcomes to the logs and indices (loop only)."""
+        while True:
+            try:
+                op, record = self._pending.get_nowait()
+            except queue.Empty:
+                return
+            if op == "observe":
+                self.activity_log.append(record)
+                self.total_observations += 1
+            elif op == "success":
+                self.successful_approaches.append(record)
+                self.total_successes += 1
+                self._succ_by_cat[record["category"]].append(record)
+            else:
+                self.failed_approaches.append(record)
+                self.total_failures += 1
+                self._fail_by_cat[record["category"]].append(record)
 
     # ── Briefing Generation ────────────────────────────────────────
 
     def _build_activity_summary(self, category: str) -> str:
         """Build compact summary of activity for the Operator to review."""
-        lines = []
+        self._drain_pending()
+        # Every part ends in "\n" and is joined once at the end
+        parts = []
 
         if self.successful_approaches:
-            lines.append(f"SOLVED ({len(self.successful_approaches)} groups so far):")
-            for s in self.successful_approaches[-5:]:
-                lines.append(f"  [{s['category']}] {s['approach'][:120]} -> solved {s['count']}")
-
-        cat_fails = [f for f in self.failed_approaches if f["category"] == category]
+            parts.append(f"SOLVED ({self.total_successes} groups so far):\n")
+            # Tail via reversed(): islice from the front would walk the deque
+            recent = list(itertools.islice(reversed(self.successful_approaches), 5))
+            parts.extend(
+                f"  [{s['category']}] {s['approach_120']} -> solved {s['count']}\n"
+                for s in reversed(recent))
+
+        cat_fails = self._fail_by_cat.get(category, ())
         if cat_fails:
-            lines.append(f"FAILED for {category} tasks:")
-            for f in cat_fails[-3:]:
-                lines.append(f"  {f['approach'][:120]}")
-
-        other_fails = [f for f in self.failed_approaches if f["category"] != category][-2:]
+            parts.append(f"FAILED for {category} tasks:\n")
+            recent = list(itertools.islice(reversed(cat_fails), 3))
+            parts.extend(f"  {f['approach_120']}\n" for f in reversed(recent))
+
+        # Last two failures from other categories, scanning back from newest
+        other_fails = []
+        for f in reversed(self.failed_approaches):
+            if f["category"] != category:
+                other_fails.append(f)
+                if len(other_fails) == 2:
+                    break
         if other_fails:
-            lines.append("Other failed approaches:")
-            for f in other_fails:
-                lines.append(f"  [{f['category']}] {f['approach'][:80]}")
+            parts.append("Other failed approaches:\n")
+            parts.extend(f"  [{f['category']}] {f['approach_80']}\n"
+                         for f in reversed(other_fails))
 
-        return "\n".join(lines)
+        return "".join(parts)
 
     async def _generate(self, prompt: str, system: str = "") -> Optional[str]:
-        """Call lightweight model for briefing generation."""
+        """
+        Call lightweight model for briefing generation.
+
+        Streams the reply and stops at the first paragraph break (or after
+        BRIEFING_MAX_CHUNKS chunks); closing the stream early cancels the
+        rest of the generation on the Ollama side.
+        """
         payload = {
             "model": self.operator_model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
             "think": False,  # CRITICAL: prevents thinking token leak
-            "options": {"temperature": 0.3, "num_predict": 512}
+            "options": {"temperature": 0.3, "num_predict": BRIEFING_NUM_PREDICT}
         }
         if system:
             payload["system"] = system
 
+        body = _json_dumps(payload)
         try:
             if self._client:
                 # httpx path
-                resp = await self._client.post(
-                    f"{self.ollama_url}/api/generate",
-                    json=payload,
+                async with self._client.stream(
+                    "POST",
+                    self._generate_url,
+                    content=body,
+                    headers=_JSON_HEADERS,
                     timeout=self.operator_timeout
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    result = data.get("response", "")
-                    # Fallback: extract from thinking field if needed
-                    if not result and data.get("thinking"):
-                        result = data["thinking"]
-                    return result
+                ) as resp:
+                    if resp.status_code == 200:
+                        return await self._read_briefing_stream(resp.aiter_lines())
             else:
                 # aiohttp fallback
-                import aiohttp
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        f"{self.ollama_url}/api/generate",
-                        json=payload,
-                        timeout=aiohttp.ClientTimeout(total=self.operator_timeout)
-                    ) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            return data.get("response", "")
+                if self._aiohttp_session is None:
+                    self._aiohttp_session = self._new_aiohttp_session()
+                async with self._aiohttp_session.post(
+                    self._generate_url,
+                    data=body,
+                    headers=_JSON_HEADERS,
+                ) as resp:
+                    if resp.status == 200:
+                        return await self._read_briefing_stream(resp.content)
             return None
         except Exception:
             return None
 
+    @staticmethod
+    async def _read_briefing_stream(lines) -> str:
+        """Collect streamed NDJSON chunks up to the end of the first paragraph."""
+        text = ""
+        thinking = ""
+        chunks = 0
+        async for line in lines:
+            if not line.strip():
+                continue
+            chunks += 1
+            chunk = _json_loads(line)
+            piece = chunk.get("response", "")
+            text += piece
+            thinking += chunk.get("thinking", "")
+            if chunk.get("done") or chunks >= BRIEFING_MAX_CHUNKS:
+                break
+            if "\n" in piece and "\n\n" in text.lstrip():
+                break
+
+        result = text.lstrip().split("\n\n", 1)[0]
+        # Fallback: extract from thinking field if needed
+        if not result and thinking:
+            result = thinking
+        return result
+
+    async def _submit(self, prompt: str, system: str = "") -> Optional[str]:
+        """Queue a prompt for the next briefing batch and await its result."""
+        if self._batch_task is None:
+            return await self._generate(prompt, system)
+        future = asyncio.get_running_loop().create_future()
+        self._briefing_queue.put_nowait((prompt, system, future))
+        return await future
+
+    async def _briefing_batcher(self):
+        """
+        Collect queued briefings for up to BRIEFING_BATCH_WINDOW seconds (or
+        BRIEFING_MAX_BATCH items) and send each batch concurrently, so Ollama
+        can schedule them together across its OLLAMA_NUM_PARALLEL slots.
+        """
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch = [await self._briefing_queue.get()]
+                deadline = loop.time() + BRIEFING_BATCH_WINDOW
+                while len(batch) < BRIEFING_MAX_BATCH:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(
+                            self._briefing_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                # Dispatch in the background and keep collecting the next batch
+                task = asyncio.create_task(self._dispatch_batch(batch))
+                self._dispatch_tasks.add(task)
+                task.add_done_callback(self._dispatch_tasks.discard)
+                batch = []
+        finally:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _dispatch_batch(self, batch: list):
+        """Run one batch of briefing prompts concurrently."""
+        results = await asyncio.gather(
+            *(self._generate(prompt, system) for prompt, system, _ in batch),
+            return_exceptions=True,
+        )
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(None if isinstance(result, BaseException) else result)
+
     async def generate_briefing(self, task_id: str, category: str,
                                 profile: str, group_size: int) -> str:
         """
@@ -244,42 +513,70 @@ class OperatorOversight:
         Uses lightweight model to produce intelligent briefing based on
         all observed activity. Returns empty string if no useful context.
         """
+        self._drain_pending()
         if not self.successful_approaches and not self.failed_approaches:
             return ""
+        if time.monotonic() < self._breaker_open_until:
+            return ""
 
         activity = self._build_activity_summary(category)
         if not activity.strip():
             return ""
-
-        prompt = f"""You are the Operator coordinating research across multiple task groups.
-
-Current batch progress:
-{activity}
-
-A new group is about to be researched:
-- Category: {category}
-- Group size: {group_size} tasks
-- Profile: {profile[:300]}
-
-In 2-3 sentences, suggest what the worker should consider:
-- What worked for similar tasks that might apply here?
-- What failed that should be avoided?
-- Any patterns you notice across groups?
-
-Be specific and concise. These are suggestions, not orders."""
-
-        system = ("You are the Operator - an executive coordinator for AI research. "
-                  "Generate brief, specific suggestions to help workers "
-                  "avoid duplicating effort. Be direct and actionable.")
-
+        prompt = (BRIEFING_PROMPT_HEAD + activity + BRIEFING_PROMPT_TAIL.format(
+            category=category, group_size=group_size, profile=profile[:300]))
+
+        # One identity for in-flight and cached briefings: the prompt itself
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Shield so one waiter's cancellation doesn't cancel the others
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            briefing = await self._generate(prompt, system)
-            if briefing and len(briefing.strip()) > 20:
+            briefing = await self._produce_briefing(prompt, key)
+            future.set_result(briefing)
+            return briefing
+        finally:
+            del self._inflight[key]
+            if not future.done():
+                future.set_result("")  # Owner was cancelled; release waiters
+
+    async def _produce_briefing(self, prompt: str, cache_key: bytes) -> str:
+        """Run one briefing prompt through the Operator model (or the cache)."""
+        # Identical prompt seen recently: reuse its briefing, skip the model
+        cached = self._briefing_cache.get(cache_key)
+        if cached:
+            if time.monotonic() - cached[0] < BRIEFING_CACHE_TTL:
+                self._briefing_cache.move_to_end(cache_key)
                 self.total_suggestions_made += 1
-                return f"\n[Operator notes] {briefing.strip()}"
-            return ""
-        except Exception:
+                return cached[1]
+            del self._briefing_cache[cache_key]
+
+        try:
+            # Hard outer deadline: queueing + generation never blocks workers
+            briefing = await asyncio.wait_for(self._submit(prompt, BRIEFING_SYSTEM),
+                                              timeout=self.operator_timeout)
+        except Exception:  # includes asyncio.TimeoutError
+            briefing = None
+
+        if briefing is None:
+            self._breaker_fails += 1
+            if self._breaker_fails >= BREAKER_THRESHOLD:
+                self._breaker_open_until = time.monotonic() + BREAKER_COOLDOWN
+                self._breaker_fails = 0
             return ""
+        self._breaker_fails = 0
+
+        if len(briefing.strip()) > 20:
+            self.total_suggestions_made += 1
+            result = f"\n[Operator notes] {briefing.strip()}"
+            self._briefing_cache[cache_key] = (time.monotonic(), result)
+            if len(self._briefing_cache) > BRIEFING_CACHE_SIZE:
+                self._briefing_cache.popitem(last=False)
+            return result
+        return ""
 
     # ── Main Entry Point ───────────────────────────────────────────
 
@@ -294,47 +591,82 @@ Be specific and concise. These are suggestions, not orders."""
 
         Returns string to inject into worker prompt before generation.
         """
-        self.groups_processed += 1
-
-        # Tier 1: Fast mechanical context
-        mechanical = []
+        mech, briefing = await self._gather_context(task_id, category, profile, group_size)
+        parts = [p for p in [mech[2], briefing] if p.strip()]
+        return "\n\n".join(parts)
 
-        relevant_successes = [s for s in self.successful_approaches
-                              if s["category"] == category]
-        if relevant_successes:
-            mechanical.append("Prior successes for similar tasks:")
-            for s in relevant_successes[:3]:
-                mechanical.append(f"  - {s['approach'][:150]} (solved {s['count']})")
+    async def get_context_bytes(self, task_id: str, category: str,
+                                profile: str = "", group_size: int = 1) -> bytes:
+        """
+        Same as get_context(), UTF-8 encoded.
 
-        cat_failures = [f for f in self.failed_approaches
-                        if f["category"] == category]
-        if cat_failures:
-            mechanical.append("Prior failures (avoid):")
-            for f in cat_failures[:3]:
-                mechanical.append(f"  - {f['approach'][:100]}")
+        The mechanical part is encoded once per cache entry, so callers that
+        assemble worker prompts as bytes skip re-encoding the stable text.
+        """
+        mech, briefing = await self._gather_context(task_id, category, profile, group_size)
+        parts = [p for p in [mech[3], briefing.encode("utf-8")] if p.strip()]
+        return b"\n\n".join(parts)
+
+    async def _gather_context(self, task_id: str, category: str,
+                              profile: str, group_size: int):
+        """Return (mechanical cache entry, briefing) for one worker group."""
+        self._drain_pending()
+        self.groups_processed += 1
 
-        mech_text = "\n".join(mechanical)
+        # Cold path: nothing for this category and too little for a briefing
+        total_approaches = len(self.successful_approaches) + len(self.failed_approaches)
+        if (total_approaches < 2 and not self._succ_by_cat.get(category)
+                and not self._fail_by_cat.get(category)):
+            return _EMPTY_MECH, ""
+
+        # Tier 1: Fast mechanical context (cached until new outcomes arrive)
+        n_succ = self.total_successes
+        n_fail = self.total_failures
+        mech = self._mech_cache.get(category)
+        if not mech or mech[0] != n_succ or mech[1] != n_fail:
+            mechanical = []
+
+            relevant_successes = self._succ_by_cat.get(category, ())
+            if relevant_successes:
+                mechanical.append("Prior successes for similar tasks:")
+                for s in itertools.islice(relevant_successes, 3):
+                    mechanical.append(f"  - {s['approach_150']} (solved {s['count']})")
+
+            cat_failures = self._fail_by_cat.get(category, ())
+            if cat_failures:
+                mechanical.append("Prior failures (avoid):")
+                for f in itertools.islice(cat_failures, 3):
+                    mechanical.append(f"  - {f['approach_100']}")
+
+            mech_text = "\n".join(mechanical)
+            mech = (n_succ, n_fail, mech_text, mech_text.encode("utf-8"))
+            self._mech_cache[category] = mech
 
         # Tier 2: Intelligent briefing (only after enough context)
         briefing = ""
-        total_approaches = len(self.successful_approaches) + len(self.failed_approaches)
         if total_approaches >= 2:
             briefing = await self.generate_briefing(task_id, category, profile, group_size)
 
-        parts = [p for p in [mech_text, briefing] if p.strip()]
-        return "\n\n".join(parts)
+        return mech, briefing
 
     # ── Reporting ──────────────────────────────────────────────────
 
     def summary(self) -> dict:
-        """Return summary statistics for logging/reporting."""
+        """
+        Return summary statistics for logging/reporting.
+
+        Safe from any thread: reads counters only and never drains the
+        queue (that is the event loop's job). Records queued but not yet
+        applied are reported as pending_records.
+        """
         return {
             "groups_processed": self.groups_processed,
-            "successful_approaches": len(self.successful_approaches),
-            "failed_approaches": len(self.failed_approaches),
+            "successful_approaches": self.total_successes,
+            "failed_approaches": self.total_failures,
             "suggestions_generated": self.total_suggestions_made,
             "profiles_cached": len(self.active_profiles),
-            "total_observations": len(self.activity_log),
+            "total_observations": self.total_observations,
+            "pending_records": self._pending.qsize(),
         }
 
     def __repr__(self):
@@ -380,4 +712,9 @@ async def example_integration():
 
 
 if __name__ == "__main__":
-    asyncio.run(example_integration())
+    try:
+        import uvloop  # libuv-backed event loop; not available on Windows
+    except ImportError:
+        asyncio.run(example_integration())
+    else:
+        uvloop.run(example_integration())